@@ -210,10 +210,11 @@ def df_to_arrow(df: pd.DataFrame) -> pa.Table:
                 else:
                     df[k] = pa.nulls(df.shape[0], pa.infer_type(df[k]))
             else:
-                df[k].where(
+                # Assign rather than filling in place: the column may share its
+                # data buffer with the caller's dataframe.
+                df[k] = df[k].where(
                     df[k].notnull(),
                     pd.Series(pa.nulls(df[k].isnull().sum(), pa.infer_type(df[k]))),
-                    inplace=True,
                 )
             null_fields.add(k)
 
@@ -572,7 +572,7 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
 
         self._check_allows_child(key, type(soma_object))
 
-        if key in self._mutated_keys.union(self._contents):
+        if key in self._mutated_keys or key in self._contents:
             # TileDB groups currently do not support replacing elements.
             # If we use a hack to flush writes, corruption is possible.
             raise SOMAError(f"replacing key {key!r} is unsupported")
@@ -149,11 +149,15 @@ class NDArray(TileDBArray, somacore.NDArray):
                 dtype=np.int64,
                 filters=create_options.dim_filters_tiledb(
                     dim_name,
+                    # soma_dim_* coordinates are sorted int64s, so delta-encode
+                    # and bit-pack them before the general-purpose compressor.
                     [
+                        "DoubleDeltaFilter",
+                        "BitWidthReductionFilter",
                         dict(
                             _type="ZstdFilter",
                             level=create_options.sparse_nd_array_dim_zstd_level,
-                        )
+                        ),
                     ],
                 ),
             )
@@ -6,7 +6,7 @@
 """
 Implementation of a SOMA DataFrame
 """
-from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -723,19 +723,34 @@ def _build_tiledb_schema(
             index_column_name, tiledb_create_options, dtype, slot_domain
         )
 
+        # Dimension coordinates for integer/datetime dims (soma_joinid in
+        # particular) are sorted on disk, so delta-encode and bit-pack them
+        # before the general-purpose compressor.
+        default_dim_filters: List[Union[str, Dict[str, object]]]
+        if isinstance(dtype, np.dtype) and dtype.kind in "iuM":
+            default_dim_filters = [
+                "DoubleDeltaFilter",
+                "BitWidthReductionFilter",
+                dict(
+                    _type="ZstdFilter",
+                    level=tiledb_create_options.dataframe_dim_zstd_level,
+                ),
+            ]
+        else:
+            default_dim_filters = [
+                dict(
+                    _type="ZstdFilter",
+                    level=tiledb_create_options.dataframe_dim_zstd_level,
+                )
+            ]
+
         dim = tiledb.Dim(
             name=index_column_name,
             domain=slot_domain,
             tile=extent,
             dtype=dtype,
             filters=tiledb_create_options.dim_filters_tiledb(
-                index_column_name,
-                [
-                    dict(
-                        _type="ZstdFilter",
-                        level=tiledb_create_options.dataframe_dim_zstd_level,
-                    )
-                ],
+                index_column_name, default_dim_filters
             ),
         )
         dims.append(dim)
@@ -3,7 +3,9 @@ from typing import Any, Dict, Optional, Sequence
 
 import anndata as ad
 import attrs
+import h5py
 import pandas as pd
+from anndata.experimental import read_elem
 from typing_extensions import Self
 
 import tiledbsoma
@@ -13,6 +15,11 @@ from tiledbsoma.options import SOMATileDBContext
 from .id_mappings import AxisIDMapping, ExperimentIDMapping, get_dataframe_values
 
 
+def _h5ad_group_has_keys(f: h5py.File, group_name: str) -> bool:
+    """True if the named top-level H5AD group exists and has at least one member."""
+    return group_name in f and len(f[group_name]) > 0
+
+
 @attrs.define(kw_only=True)
 class AxisAmbientLabelMapping:
     """
@@ -70,11 +77,13 @@ class AxisAmbientLabelMapping:
         tiledbsoma.logging.logger.info("Registration: registering AnnData dataframe.")
 
         index_field_name = index_field_name or df.index.name or "index"
-        df = df.reset_index()
+        # Read the labels straight from the column or index: reset_index()
+        # copies every column of the frame just to get at one of them.
+        labels = df[index_field_name] if index_field_name in df.columns else df.index
 
         data = {}
         next_soma_joinid = 0
-        for index in df[index_field_name]:
+        for index in labels:
             data[index] = next_soma_joinid
             next_soma_joinid += 1
         return cls(data=data, field_name=index_field_name)
@@ -280,9 +289,33 @@ class ExperimentAmbientLabelMapping:
                 "append-mode ingest of obsp and varp is not supported. Please retry without them."
             )
 
+        return cls._from_axis_dataframes_append_on_experiment(
+            adata.obs,
+            adata.var,
+            adata.raw.var if adata.raw is not None else None,
+            previous,
+            measurement_name=measurement_name,
+            obs_field_name=obs_field_name,
+            var_field_name=var_field_name,
+        )
+
+    @classmethod
+    def _from_axis_dataframes_append_on_experiment(
+        cls,
+        obs_df: pd.DataFrame,
+        var_df: pd.DataFrame,
+        raw_var_df: Optional[pd.DataFrame],
+        previous: Self,
+        *,
+        measurement_name: str,
+        obs_field_name: str,
+        var_field_name: str,
+    ) -> Self:
+        """Extends registration data to one more input, given just its axis
+        dataframes. Shared between the AnnData and H5AD entry points."""
         obs_next_soma_joinid = previous.obs_axis.get_next_start_soma_joinid()
         obs_map = dict(previous.obs_axis.data)
-        obs_ids = get_dataframe_values(adata.obs, obs_field_name)
+        obs_ids = get_dataframe_values(obs_df, obs_field_name)
         for obs_id in obs_ids:
             if obs_id not in obs_map:
                 obs_map[obs_id] = obs_next_soma_joinid
@@ -295,7 +328,7 @@ class ExperimentAmbientLabelMapping:
             var_next_soma_joinid = previous.var_axes[
                 measurement_name
             ].get_next_start_soma_joinid()
-        var_ids = get_dataframe_values(adata.var, var_field_name)
+        var_ids = get_dataframe_values(var_df, var_field_name)
         for var_id in var_ids:
             if var_id not in var_map:
                 var_map[var_id] = var_next_soma_joinid
@@ -303,7 +336,7 @@ class ExperimentAmbientLabelMapping:
 
         var_maps = {measurement_name: var_map}
 
-        if adata.raw is None:
+        if raw_var_df is None:
             if "raw" in previous.var_axes:
                 var_maps["raw"] = dict(previous.var_axes["raw"].data)
 
@@ -315,7 +348,7 @@ class ExperimentAmbientLabelMapping:
                 raw_var_axis = previous.var_axes["raw"]
                 raw_var_map = raw_var_axis.data
                 raw_var_next_soma_joinid = raw_var_axis.get_next_start_soma_joinid()
-            raw_var_ids = get_dataframe_values(adata.raw.var, var_field_name)
+            raw_var_ids = get_dataframe_values(raw_var_df, var_field_name)
             for raw_var_id in raw_var_ids:
                 if raw_var_id not in raw_var_map:
                     raw_var_map[raw_var_id] = raw_var_next_soma_joinid
@@ -419,15 +452,54 @@ class ExperimentAmbientLabelMapping:
         """Extends registration data to one more H5AD input file."""
         tiledbsoma.logging.logger.info(f"Registration: registering {h5ad_file_name}.")
 
-        adata = ad.read_h5ad(h5ad_file_name, "r")
+        # Registration needs only the axis dataframes, so read just those
+        # groups out of the file -- not the whole AnnData, which (even opened
+        # in backed mode) materializes obsm/varm/obsp/varp/uns up front.
+        with h5py.File(h5ad_file_name, "r") as f:
+            # Files written by anndata older than 0.8 lack the element-encoding
+            # metadata that read_elem needs to reconstruct dataframes; those
+            # fall back to the whole-file reader below.
+            is_legacy = "encoding-type" not in f["obs"].attrs
+
+            if not is_legacy:
+                # Pre-checks, mirroring from_anndata_append_on_experiment, done
+                # on group keys alone without reading any matrix data.
+                if not append_obsm_varm:
+                    if _h5ad_group_has_keys(f, "obsm") or _h5ad_group_has_keys(
+                        f, "varm"
+                    ):
+                        raise ValueError(
+                            "append-mode ingest of obsm and varm is only supported via explicit opt-in. Please drop them from the inputs, or retry with append_obsm_varm=True."
+                        )
 
-        return cls.from_anndata_append_on_experiment(
-            adata,
+                if _h5ad_group_has_keys(f, "obsp") or _h5ad_group_has_keys(f, "varp"):
+                    raise ValueError(
+                        "append-mode ingest of obsp and varp is not supported. Please retry without them."
+                    )
+
+                obs_df = read_elem(f["obs"])
+                var_df = read_elem(f["var"])
+                raw_var_df = read_elem(f["raw"]["var"]) if "raw" in f else None
+
+        if is_legacy:
+            adata = ad.read_h5ad(h5ad_file_name, "r")
+            return cls.from_anndata_append_on_experiment(
+                adata,
+                previous,
+                measurement_name=measurement_name,
+                obs_field_name=obs_field_name,
+                var_field_name=var_field_name,
+                append_obsm_varm=append_obsm_varm,
+            )
+
+        return cls._from_axis_dataframes_append_on_experiment(
+            obs_df,
+            var_df,
+            raw_var_df,
             previous,
             measurement_name=measurement_name,
             obs_field_name=obs_field_name,
             var_field_name=var_field_name,
-            append_obsm_varm=append_obsm_varm,
         )
 
     @classmethod
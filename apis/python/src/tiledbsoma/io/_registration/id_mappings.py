@@ -2,6 +2,8 @@ from typing import Dict, List, Tuple
 
 import anndata as ad
 import attrs
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import Self
 
@@ -22,6 +24,17 @@ class AxisIDMapping:
     # Tuple not List so this can't be modified by accident when passed into some function somewhere
     data: Tuple[int, ...]
 
+    def to_numpy(self) -> npt.NDArray[np.int64]:
+        """Returns the mapping as an int64 array, suitable for vectorized
+        remapping of input-file offsets to soma_joinid values."""
+        return np.asarray(self.data, dtype=np.int64)
+
+    def is_identity(self) -> bool:
+        """True if the mapping takes each input-file offset to itself, as in
+        non-append-mode ingestion. Callers can skip remapping entirely."""
+        arr = self.to_numpy()
+        return bool(np.array_equal(arr, np.arange(len(arr), dtype=np.int64)))
+
     @classmethod
     def identity(cls, n: int) -> Self:
         """This maps 0-up input-file offsets to 0-up soma_joinid values. This is
@@ -20,26 +20,36 @@ from .._types import NPNDArray, PDSeries
 _DT = TypeVar("_DT", bound=pdt.Dtype)
 _MT = TypeVar("_MT", NPNDArray, sp.spmatrix, PDSeries)
 _str_to_type = {"boolean": bool, "string": str, "bytes": bytes}
+_float16 = np.dtype("float16")
+_float32 = np.dtype("float32")
 
 
 def decategoricalize_obs_or_var(obs_or_var: pd.DataFrame) -> pd.DataFrame:
     """Performs a typecast into types that TileDB can persist."""
-    if len(obs_or_var.columns) > 0:
-        return pd.DataFrame.from_dict(
-            {
-                str(k): to_tiledb_supported_array_type(str(k), v)
-                for k, v in obs_or_var.items()
-            },
-        )
-    else:
+    if len(obs_or_var.columns) == 0:
         return obs_or_var
+    # One astype call with a per-column dtype map hits pandas' vectorized
+    # cast path, rather than rebuilding the frame column-by-column via
+    # from_dict -- and it keeps the original index instead of re-deriving it.
+    casts = {
+        k: _to_tiledb_supported_dtype(dtype)
+        for k, dtype in obs_or_var.dtypes.items()
+        if not isinstance(dtype, pd.CategoricalDtype)
+        and _to_tiledb_supported_dtype(dtype) != dtype
+    }
+    if not casts:
+        # Common case: nothing needs converting. The ingestor restructures the
+        # frame it's handed (reset_index, joinid insertion, etc.) so we still
+        # hand back a copy, but a shallow one -- no column data is duplicated.
+        return obs_or_var.copy(deep=False)
+    return obs_or_var.astype(casts)
 
 
 @typeguard_ignore
 def _to_tiledb_supported_dtype(dtype: _DT) -> _DT:
     """A handful of types are cast into the TileDB type system."""
     # TileDB has no float16 -- cast up to float32
-    return cast(_DT, np.dtype("float32")) if dtype == np.dtype("float16") else dtype
+    return cast(_DT, _float32) if dtype == _float16 else dtype
 
 
 def to_tiledb_supported_array_type(name: str, x: _MT) -> _MT:
@@ -82,3 +92,11 @@ def csr_from_tiledb_df(df: pd.DataFrame, num_rows: int, num_cols: int) -> sp.csr
         (df["soma_data"], (df["soma_dim_0"], df["soma_dim_1"])),
         shape=(num_rows, num_cols),
     )
+
+
+def dense_from_tiledb_df(df: pd.DataFrame, num_rows: int, num_cols: int) -> NPNDArray:
+    """Given a tiledb dataframe, return a dense ``numpy.ndarray``."""
+    data = df["soma_data"].to_numpy()
+    out = cast(NPNDArray, np.zeros((num_rows, num_cols), dtype=data.dtype))
+    out[df["soma_dim_0"], df["soma_dim_1"]] = data
+    return out
@@ -64,7 +64,11 @@ def test_platform_config(adata):
             assert x_sch.offsets_filters == [tiledb.RleFilter(), tiledb.NoOpFilter()]
             assert x_arr.attr("soma_data").filters == [tiledb.NoOpFilter()]
             assert x_arr.dim("soma_dim_0").tile == 6
-            assert x_arr.dim("soma_dim_0").filters == [tiledb.ZstdFilter(level=2)]
+            assert x_arr.dim("soma_dim_0").filters == [
+                tiledb.DoubleDeltaFilter(),
+                tiledb.BitWidthReductionFilter(),
+                tiledb.ZstdFilter(level=2),
+            ]
             # As of 2.17.0 this is the default when empty filter-list, or none at all,
             # is requested. Those who want truly no filtering can request a no-op filter.
             assert list(x_arr.dim("soma_dim_1").filters) == [
@@ -1035,3 +1035,60 @@ def test_append_with_disjoint_measurements(
 
         assert all(actual_X_one == expect_X_one)
         assert all(actual_X_two == expect_X_two)
+
+
+def test_append_registration_h5ad_prechecks(tmp_path, anndata1):
+    anndata1.obsm["X_pca"] = np.zeros((len(anndata1.obs), 2))
+    h5ad_with_obsm = create_h5ad(anndata1, (tmp_path / "with_obsm.h5ad").as_posix())
+
+    # obsm/varm append is refused without explicit opt-in, based on the file's
+    # group keys alone.
+    with pytest.raises(ValueError):
+        registration.ExperimentAmbientLabelMapping.from_h5ad_appends_on_experiment(
+            experiment_uri=None,
+            h5ad_file_names=[h5ad_with_obsm],
+            measurement_name="measname",
+            obs_field_name="obs_id",
+            var_field_name="var_id",
+        )
+
+    # ... and admitted with the opt-in.
+    registration.ExperimentAmbientLabelMapping.from_h5ad_appends_on_experiment(
+        experiment_uri=None,
+        h5ad_file_names=[h5ad_with_obsm],
+        measurement_name="measname",
+        obs_field_name="obs_id",
+        var_field_name="var_id",
+        append_obsm_varm=True,
+    )
+
+    del anndata1.obsm["X_pca"]
+    n_obs = len(anndata1.obs)
+    anndata1.obsp["connectivities"] = np.zeros((n_obs, n_obs))
+    h5ad_with_obsp = create_h5ad(anndata1, (tmp_path / "with_obsp.h5ad").as_posix())
+
+    # obsp/varp append is never supported.
+    with pytest.raises(ValueError):
+        registration.ExperimentAmbientLabelMapping.from_h5ad_appends_on_experiment(
+            experiment_uri=None,
+            h5ad_file_names=[h5ad_with_obsp],
+            measurement_name="measname",
+            obs_field_name="obs_id",
+            var_field_name="var_id",
+            append_obsm_varm=True,
+        )
+
+
+def test_axis_id_mapping_is_identity():
+    assert registration.AxisIDMapping(data=()).is_identity()
+    assert registration.AxisIDMapping(data=(0,)).is_identity()
+    assert registration.AxisIDMapping(data=(0, 1, 2, 3)).is_identity()
+    assert registration.AxisIDMapping.identity(10).is_identity()
+
+    # Permuted: same values, wrong order.
+    assert not registration.AxisIDMapping(data=(0, 1, 3, 2)).is_identity()
+    # Offset: the appended-input case, where remapping must not be skipped.
+    assert not registration.AxisIDMapping(data=(3, 4, 5)).is_identity()
+    assert not registration.AxisIDMapping(data=(1, 2, 3, 4)).is_identity()
+
+    assert tuple(registration.AxisIDMapping(data=(3, 4, 5)).to_numpy()) == (3, 4, 5)